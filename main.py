@@ -25,7 +25,11 @@ Notas de seguridad:
 - El manejo de excepciones asegura que cualquier error inesperado se registre
     adecuadamente y no interrumpa el flujo sin control.
 
-Ejecuta este archivo para iniciar la herramienta.
+Ejecuta este archivo para iniciar la herramienta. Con la variable de entorno
+OFFICE_UNATTENDED=1 las preguntas de consola se responden con su valor por
+defecto: se detectan las instalaciones y no se instala nada. Solo si además
+OFFICE_UNATTENDED_UNINSTALL=1 se desinstalan todas las versiones detectadas
+y se eliminan después las carpetas temporales de la desinstalación.
 """
 
 import logging
@@ -39,16 +43,18 @@ from colorama import Fore, Style
 from manager_office_tool import (
     OfficeInstaller,
     OfficeManager,
-    OfficeSelectionWindow,
     ask_menu_option,
     ask_multiple_valid_indices,
     ask_single_valid_index,
     ask_yes_no,
     clean_folders,
     ensure_subfolder,
+    flush_logs,
     get_temp_dir,
     init_logging,
+    is_unattended,
     run_uninstallers,
+    unattended_uninstall,
 )
 
 
@@ -108,10 +114,12 @@ def main() -> None:
         )
 
         # Fuerza el vaciado inmediato de buffers de consola y archivo
-        for handler in logging.getLogger().handlers:
-            handler.flush()
+        flush_logs()
 
     except KeyError:
+        if is_unattended():
+            print("No se pudo preparar el entorno temporal.")
+            return
         print(
             "No se pudo preparar el entorno temporal. Presione cualquier "
             "tecla para salir..."
@@ -124,7 +132,8 @@ def main() -> None:
         if ask_yes_no(
             f"{Fore.LIGHTCYAN_EX}"
             "¿Desea detectar las versiones de Office instaladas? (S/N):"
-            f"{Style.RESET_ALL}"
+            f"{Style.RESET_ALL}",
+            default=True,
         ):
             manager = OfficeManager(show_all=False)
             installations = manager.get_installations()
@@ -137,7 +146,8 @@ def main() -> None:
                         f"{Fore.LIGHTCYAN_EX}"
                         "¿Desea desinstalar "
                         "la versión encontrada con ODT? (S/N):"
-                        f"{Style.RESET_ALL}"
+                        f"{Style.RESET_ALL}",
+                        default=unattended_uninstall(),
                     ):
                         office_uninstall_dir = ensure_subfolder(
                             temp_dir, "UninstallOfficeFiles"
@@ -178,7 +188,11 @@ def main() -> None:
                         f"{Style.RESET_ALL}"
                     )
 
-                    opcion = ask_menu_option({"1", "2", "3", "4"}, "Opción")
+                    opcion = ask_menu_option(
+                        {"1", "2", "3", "4"},
+                        "Opción",
+                        default="2" if unattended_uninstall() else "1",
+                    )
 
                     if opcion == "1":
                         logging.info(
@@ -296,7 +310,9 @@ def main() -> None:
         if ask_yes_no(
             f"{Fore.LIGHTCYAN_EX}"
             "¿Desea proceder con una nueva instalación de Office? (S/N): "
-            f"{Style.RESET_ALL}"
+            f"{Style.RESET_ALL}",
+            # La instalación requiere la ventana de selección
+            default=False,
         ):
             logging.info(
                 f"{Fore.GREEN}"
@@ -306,6 +322,9 @@ def main() -> None:
             office_install_dir = ensure_subfolder(
                 temp_dir, "InstallOfficeFiles"
             )
+            # La GUI se importa aquí para no cargar Tk si no se instala
+            from manager_office_tool import OfficeSelectionWindow
+
             selection_window = OfficeSelectionWindow(office_install_dir)
             install_subdir_path, selected_version, selected_language_id = (
                 selection_window.show()
@@ -361,15 +380,18 @@ def main() -> None:
             if ask_yes_no(
                 f"{Fore.LIGHTCYAN_EX}"
                 "¿Deseas eliminar las carpetas temporales creadas por el script? (S/N): "
-                f"{Style.RESET_ALL}"
+                f"{Style.RESET_ALL}",
+                default=True,
             ):
                 clean_folders(folders_to_clean)
-        print(
-            f"{Fore.LIGHTWHITE_EX}"
-            "Presione cualquier tecla para salir..."
-            f"{Style.RESET_ALL}"
-        )
-        msvcrt.getch()
+        # En modo desatendido no se espera una tecla para cerrar
+        if not is_unattended():
+            print(
+                f"{Fore.LIGHTWHITE_EX}"
+                "Presione cualquier tecla para salir..."
+                f"{Style.RESET_ALL}"
+            )
+            msvcrt.getch()
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ Paquete principal de ManagerOfficeScriptTool.
 
 Define la API pública del proyecto y expone las clases, funciones y utilidades
 principales para facilitar su uso desde scripts externos como main.py.
+OfficeSelectionWindow se carga de forma diferida al accederla.
 """
 
 from .core import (
@@ -12,7 +13,6 @@ from .core import (
     RegistryReader,
     fetch_odt_download_info,
 )
-from .interface import OfficeSelectionWindow
 from .scripts import OfficeInstaller, OfficeUninstaller, run_uninstallers
 from .utils import (
     ask_menu_option,
@@ -22,11 +22,17 @@ from .utils import (
     center_window,
     clean_folders,
     ensure_subfolder,
+    flush_logs,
     get_data_path,
+    get_executor,
     get_temp_dir,
     init_logging,
+    is_unattended,
+    run_setup_command,
     safe_log_path,
     safe_log_registry_key,
+    unattended_uninstall,
+    write_bytes_atomic,
 )
 
 __all__ = [
@@ -43,12 +49,28 @@ __all__ = [
     "ask_menu_option",
     "ask_single_valid_index",
     "ask_multiple_valid_indices",
+    "is_unattended",
+    "unattended_uninstall",
     "center_window",
     "clean_folders",
     "ensure_subfolder",
     "get_data_path",
     "get_temp_dir",
     "init_logging",
+    "flush_logs",
     "safe_log_path",
     "safe_log_registry_key",
+    "write_bytes_atomic",
+    "run_setup_command",
+    "get_executor",
 ]
+
+
+def __getattr__(name: str):
+    # La interfaz gráfica (ttkbootstrap/Tk) se importa solo al usarla: las
+    # ejecuciones que no instalan Office no cargan Tk
+    if name == "OfficeSelectionWindow":
+        from .interface import OfficeSelectionWindow
+
+        return OfficeSelectionWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -43,11 +43,16 @@ HEADERS = {
 }
 
 MAX_HTML_SIZE = 2 * 1024 * 1024  # 2 MB
+HTML_CHUNK_SIZE = 1 << 16  # 64 KiB: pocas iteraciones por página
 MAX_CACHE_SIZE = 100  # límite arbitrario para evitar crecimiento indefinido
 
 # Caché LRU para evitar descargar la misma página varias veces, con límite
 _FETCH_CACHE: OrderedDict[str, Dict[str, object]] = OrderedDict()
 
+# Sesión HTTP compartida: reutiliza conexiones (keep-alive) y sesiones TLS
+# entre todas las solicitudes a los servidores de Microsoft
+_SESSION: Optional[requests.Session] = None
+
 
 def domain_allowed(hostname: Optional[str]) -> bool:
     """
@@ -116,19 +121,26 @@ def sanitize_filename(name: str) -> str:
 
 def get_requests_session() -> requests.Session:
     """
-    Crea una sesión de requests con reintentos para mejorar robustez.
+    Devuelve la sesión de requests compartida, con reintentos y pool de
+    conexiones. Se crea en el primer uso y se reutiliza en las siguientes
+    llamadas para evitar repetir el handshake TCP+TLS en cada solicitud.
     """
-    session = requests.Session()
-    retries = Retry(
-        total=3,
-        backoff_factor=0.5,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET", "HEAD"],
-    )
-    adapter = HTTPAdapter(max_retries=retries)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
-    return session
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "HEAD"],
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=8, max_retries=retries
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _SESSION = session
+    return _SESSION
 
 
 def get_page_html(url: str) -> Optional[str]:
@@ -146,7 +158,7 @@ def get_page_html(url: str) -> Optional[str]:
 
             content = []
             total = 0
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in response.iter_content(chunk_size=HTML_CHUNK_SIZE):
                 total += len(chunk)
                 if total > MAX_HTML_SIZE:
                     logging.error(
@@ -9,6 +9,7 @@ Incluye manejo de reintentos, descargas reanudables y extracción silenciosa.
 import logging
 import os
 import random
+import shutil
 import subprocess
 import tempfile
 import time
@@ -19,11 +20,13 @@ from urllib.parse import urlparse
 import requests
 from colorama import Fore, Style
 from manager_office_tool.utils import safe_log_path
-from requests.adapters import HTTPAdapter
 from tqdm import tqdm
-from urllib3.util.retry import Retry
+from tqdm.utils import CallbackIOWrapper
+from urllib3.exceptions import HTTPError
 
-from .odt_fetcher import fetch_odt_download_info
+from .odt_fetcher import fetch_odt_download_info, get_requests_session
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB por lectura/escritura
 
 
 class ODTManager:
@@ -103,17 +106,16 @@ class ODTManager:
         Verifica si el archivo descargado es válido según nombre y
         tamaño esperados.
         """
-        if not path.exists():
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
             return False
-        valid = (
-            self.expected_name == path.name
-            and path.stat().st_size == self.expected_size
-        )
+        valid = self.expected_name == path.name and size == self.expected_size
         if not valid:
             logging.debug(
                 f"Archivo no válido: esperado '{self.expected_name}' "
                 f"({self.expected_size} bytes), recibido '{path.name}' "
-                f"({path.stat().st_size} bytes)"
+                f"({size} bytes)"
             )
         return valid
 
@@ -145,21 +147,14 @@ class ODTManager:
             logging.error(f"{Fore.RED}{msg}{Style.RESET_ALL}")
             return False
 
-        office_dir = Path(self.office_dir)
+        office_dir = self.office_dir
         office_dir.mkdir(parents=True, exist_ok=True)
         exe_file_name = Path(urlparse(url).path).name
         exe_path = office_dir / exe_file_name
         sanitized_path = safe_log_path(exe_path)
         sanitized_dir = safe_log_path(self.office_dir)
 
-        session = requests.Session()
-        retries = Retry(
-            total=max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            respect_retry_after_header=True,
-        )
-        session.mount("https://", HTTPAdapter(max_retries=retries))
+        session = get_requests_session()
 
         with tempfile.NamedTemporaryFile(dir=office_dir, delete=False) as tmp:
             tmp_path = Path(tmp.name)
@@ -173,12 +168,17 @@ class ODTManager:
                     )
                     break
                 headers = {}
-                downloaded = (
-                    tmp_path.stat().st_size if tmp_path.exists() else 0
-                )
+                try:
+                    downloaded = tmp_path.stat().st_size
+                except FileNotFoundError:
+                    downloaded = 0
                 if downloaded:
                     try:
-                        head = session.head(url, timeout=(3, 10))
+                        # Sigue redirecciones: las cabeceras válidas son
+                        # las de la respuesta final, no las del 30x
+                        head = session.head(
+                            url, timeout=(3, 10), allow_redirects=True
+                        )
                         accept_ranges = head.headers.get(
                             "Accept-Ranges", ""
                         ).lower()
@@ -221,38 +221,58 @@ class ODTManager:
                         url, stream=True, timeout=(3, 30), headers=headers
                     )
                     response.raise_for_status()
+                    if downloaded and response.status_code != 206:
+                        # El servidor ignoró el Range y envía el archivo
+                        # completo: se reescribe desde el principio en lugar
+                        # de añadirlo al final del parcial
+                        logging.warning(
+                            f"{Fore.YELLOW}"
+                            "El servidor no reanudó la descarga. "
+                            "Descargando desde cero."
+                            f"{Style.RESET_ALL}"
+                        )
+                        downloaded = 0
                     total_size = (
                         int(response.headers.get("Content-Length", 0))
                         + downloaded
                     )
 
-                    with open(tmp_path, "ab") as f, tqdm(
+                    # Copia en bloques grandes directamente desde el socket;
+                    # la barra de progreso se actualiza en cada escritura
+                    response.raw.decode_content = True
+                    with open(
+                        tmp_path,
+                        "ab" if downloaded else "wb",
+                        buffering=DOWNLOAD_CHUNK_SIZE,
+                    ) as f, tqdm(
                         total=total_size,
                         initial=downloaded,
                         unit="B",
                         unit_scale=True,
                         desc=(f"INFO - [{attempt}/{max_retries}]"),
                     ) as bar:
-                        for chunk in response.iter_content(8192):
-                            if chunk:
-                                f.write(chunk)
-                                f.flush()
-                                os.fsync(f.fileno())
-                                bar.update(len(chunk))
+                        shutil.copyfileobj(
+                            response.raw,
+                            CallbackIOWrapper(bar.update, f, "write"),
+                            length=DOWNLOAD_CHUNK_SIZE,
+                        )
+                        f.flush()
+                        os.fsync(f.fileno())
 
                     tmp_path.replace(exe_path)
+                    # bar.n incluye lo ya descargado antes de reanudar
                     logging.debug(
                         "[*] Archivo descargado exitosamente en: "
                         f"{sanitized_path}"
                     )
                     logging.debug(
                         f"Tamaño esperado: {self.expected_size} bytes, "
-                        f"tamaño real: {exe_path.stat().st_size} bytes"
+                        f"tamaño real: {bar.n} bytes"
                     )
 
                     if self._is_valid_download(exe_path):
                         break
-                except requests.RequestException as e:
+                except (requests.RequestException, HTTPError) as e:
                     logging.warning(
                         f"Error en descarga (intento {attempt}): {e}"
                     )
@@ -312,14 +332,13 @@ class ODTManager:
                         "Error inesperado durante la extracción del ODT."
                     )
         finally:
-            if tmp_path.exists():
-                try:
-                    tmp_path.unlink()
-                except OSError:
-                    msg = (
-                        "[CONSOLE] No se pudo eliminar el archivo temporal: "
-                        f"{sanitized_tmp_path}"
-                    )
-                    logging.warning(f"{Fore.YELLOW}{msg}{Style.RESET_ALL}")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                msg = (
+                    "[CONSOLE] No se pudo eliminar el archivo temporal: "
+                    f"{sanitized_tmp_path}"
+                )
+                logging.warning(f"{Fore.YELLOW}{msg}{Style.RESET_ALL}")
 
         return False
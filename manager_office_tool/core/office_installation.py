@@ -8,6 +8,10 @@ relevante desde el comando de desinstalación.
 
 import re
 
+# Patrones para extraer datos de la cadena de desinstalación
+_RE_CULTURE = re.compile(r"culture=([a-zA-Z\-]+)")
+_RE_PLATFORM = re.compile(r"platform=(x86|x64)", re.IGNORECASE)
+
 
 class OfficeInstallation:
     """
@@ -28,6 +32,23 @@ class OfficeInstallation:
         uninstall_string (str): Comando de desinstalación.
     """
 
+    # Sin __dict__ por instancia: atributos fijos y acceso más rápido
+    __slots__ = (
+        "name",
+        "version",
+        "install_path",
+        "click_to_run",
+        "uninstall_string",
+        "updates_enabled",
+        "bitness_original",
+        "product_original",
+        "update_url",
+        "media_type",
+        "client_culture",
+        "bitness",
+        "product",
+    )
+
     def __init__(
         self,
         name: str,
@@ -55,16 +76,14 @@ class OfficeInstallation:
 
         # Extrae el idioma (culture) desde la cadena de desinstalación
         # si está presente
-        match_culture = re.search(r"culture=([a-zA-Z\-]+)", uninstall_string)
+        match_culture = _RE_CULTURE.search(uninstall_string)
         self.client_culture = (
             match_culture.group(1) if match_culture else client_culture
         )
 
         # Extrae la arquitectura (bitness) desde la cadena de desinstalación
         # si está presente
-        match_platform = re.search(
-            r"platform=(x86|x64)", uninstall_string, re.IGNORECASE
-        )
+        match_platform = _RE_PLATFORM.search(uninstall_string)
         if match_platform:
             self.bitness = (
                 "64-Bits"
@@ -8,14 +8,21 @@ OfficeInstallation para representar cada hallazgo.
 
 import logging
 import re
-from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
 from colorama import Fore, Style
+from manager_office_tool.utils import get_executor
 
 from .office_installation import OfficeInstallation
 from .registry_utils import RegistryReader
 
+# Nombres de producto que identifican una instalación relevante de Office
+# (una sola pasada sobre DisplayName en lugar de varias búsquedas)
+_OFFICE_NAME_RE = re.compile(
+    "Microsoft Office|Microsoft 365|Office 365|Office LTSC|Office ProPlus"
+    "|Microsoft Project|Microsoft Visio"
+)
+
 
 class OfficeManager:
     """
@@ -33,16 +40,83 @@ class OfficeManager:
         self.show_all = show_all
         self.registry = RegistryReader()
         self.installations: List[OfficeInstallation] = []
+        # El resultado del escaneo se reutiliza hasta llamar a invalidate()
+        self._scanned = False
+
+    def invalidate(self) -> None:
+        """
+        Descarta las instalaciones detectadas y los valores leídos del
+        registro, de modo que la próxima consulta vuelva a escanear
+        (por ejemplo, después de desinstalar).
+        """
+        self.registry = RegistryReader()
+        self.installations = []
+        self._scanned = False
 
-    def _get_installations(self) -> List[OfficeInstallation]:
+    def _read_display_name(self, uninstall_key_path: str) -> str:
+        """
+        Lee el DisplayName de una subclave de desinstalación.
+        """
+        return self.registry.get_registry_value(
+            uninstall_key_path, "DisplayName"
+        )
+
+    def _scan_uninstall_entries(
+        self, uninstall_keys: List[str]
+    ) -> List[Tuple[str, str]]:
+        """
+        Enumera las subclaves de desinstalación, lee su DisplayName y se
+        queda con las relevantes (todas si show_all es True).
+
+        Args:
+            uninstall_keys (List[str]): Claves Uninstall a recorrer.
+
+        Returns:
+            List[Tuple[str, str]]: Pares (ruta de la subclave, DisplayName)
+                en el orden de enumeración.
+        """
+        # Las claves Uninstall quedan abiertas durante el recorrido, así cada
+        # subclave se abre de forma relativa a ellas
+        with self.registry.open_keys(uninstall_keys):
+            # Las rutas del registro siempre usan "\\" como separador
+            subkey_paths = [
+                f"{uninstall_key}\\{subkey}"
+                for uninstall_key in uninstall_keys
+                for subkey in self.registry.get_registry_keys(uninstall_key)
+            ]
+            # Las lecturas del registro liberan el GIL: se solapan en varios
+            # hilos y se procesan luego en orden
+            display_names = list(
+                get_executor().map(self._read_display_name, subkey_paths)
+            )
+        # El filtro por nombre no depende de la configuración de Office:
+        # se aplica una sola vez aquí y no en cada versión detectada
+        return [
+            (path, name)
+            for path, name in zip(subkey_paths, display_names)
+            if name and (self.show_all or _OFFICE_NAME_RE.search(name))
+        ]
+
+    def _get_installations(
+        self, refresh: bool = False
+    ) -> List[OfficeInstallation]:
         """
         Busca y almacena las instalaciones de Microsoft Office detectadas
-        en el sistema.
+        en el sistema. El registro se recorre una sola vez; las llamadas
+        siguientes devuelven el resultado guardado.
+
+        Args:
+            refresh (bool): Si es True, vuelve a escanear el registro.
 
         Returns:
             List[OfficeInstallation]: Lista de objetos OfficeInstallation
                 encontrados.
         """
+        if refresh:
+            self.invalidate()
+        elif self._scanned:
+            return self.installations
+
         office_keys = [
             r"SOFTWARE\Microsoft\Office",
             r"SOFTWARE\Wow6432Node\Microsoft\Office",
@@ -55,140 +129,118 @@ class OfficeManager:
         found_names: set[str] = set()
         installations: List[OfficeInstallation] = []
 
+        # Las entradas de desinstalación no dependen de la versión: se
+        # enumeran una sola vez, y solo si hay alguna configuración
+        uninstall_entries: Optional[List[Tuple[str, str]]] = None
+
         for office_key in office_keys:
             for version in versions:
                 if version == "ClickToRun":
-                    version_key = str(
-                        Path(office_key) / version / "Configuration"
-                    )
+                    version_key = f"{office_key}\\{version}\\Configuration"
                 else:
-                    version_key = str(
-                        Path(office_key)
-                        / version
-                        / "ClickToRun"
-                        / "Configuration"
+                    version_key = (
+                        f"{office_key}\\{version}\\ClickToRun\\Configuration"
                     )
 
+                # Sin Platform la configuración se descarta: se lee primero
+                # para no registrar avisos por el resto de valores
                 platform_value = self.registry.get_registry_value(
                     version_key, "Platform"
                 )
                 if not platform_value:
                     continue
 
+                # Lee el resto de valores con una sola apertura de la clave
+                config = self.registry.get_registry_values(
+                    version_key,
+                    [
+                        "UpdatesEnabled",
+                        "CDNBaseUrl",
+                        "ProductReleaseIds",
+                        "ClientCulture",
+                    ],
+                )
+
                 bitness = (
                     "64-Bits" if platform_value.lower() == "x64" else "32-Bits"
                 )
-                updates_enabled = (
-                    self.registry.get_registry_value(
-                        version_key, "UpdatesEnabled"
-                    )
-                    == "True"
-                )
-                update_url = self.registry.get_registry_value(
-                    version_key, "CDNBaseUrl"
-                )
+                updates_enabled = config["UpdatesEnabled"] == "True"
+                update_url = config["CDNBaseUrl"]
 
-                product_ids_raw = self.registry.get_registry_value(
-                    version_key, "ProductReleaseIds"
-                )
+                product_ids_raw = config["ProductReleaseIds"]
                 product_id_map = {}
                 product_list = []
                 if product_ids_raw:
                     product_list = [
-                        p.strip()
-                        for p in product_ids_raw.split(",")
-                        if p.strip()
+                        p
+                        for p in map(str.strip, product_ids_raw.split(","))
+                        if p
                     ]
+                    # Busca el MediaType exactamente como está en el registro
+                    media_types = self.registry.get_registry_values(
+                        version_key,
+                        [f"{pid}.MediaType" for pid in product_list],
+                    )
                     for pid in product_list:
-                        # Busca el MediaType exactamente como está en el
-                        # registro
-                        media = self.registry.get_registry_value(
-                            version_key, f"{pid}.MediaType"
-                        )
-                        product_id_map[pid] = media if media else ""
+                        product_id_map[pid] = media_types[f"{pid}.MediaType"]
 
                 # ProductID: toma siempre el primero de ProductReleaseIds
                 product_id = product_list[0] if product_list else ""
                 media_type = product_id_map.get(product_id, "")
 
-                client_culture = (
-                    self.registry.get_registry_value(
-                        version_key, "ClientCulture"
+                client_culture = config["ClientCulture"] or ""
+
+                if uninstall_entries is None:
+                    uninstall_entries = self._scan_uninstall_entries(
+                        uninstall_keys
                     )
-                    or ""
-                )
+                for uninstall_key_path, display_name in uninstall_entries:
+                    if display_name in found_names:
+                        continue
 
-                for uninstall_key in uninstall_keys:
-                    subkeys = self.registry.get_registry_keys(uninstall_key)
-                    for subkey in subkeys:
-                        uninstall_key_path = str(Path(uninstall_key) / subkey)
-                        display_name = self.registry.get_registry_value(
-                            uninstall_key_path, "DisplayName"
-                        )
-                        if not display_name or display_name in found_names:
-                            continue
-
-                        # Filtra las instalaciones relevantes según el nombre
-                        if not self.show_all and not (
-                            "Microsoft Office" in display_name
-                            or "Microsoft 365" in display_name
-                            or "Office 365" in display_name
-                            or "Office LTSC" in display_name
-                            or "Office ProPlus" in display_name
-                            or "Microsoft Project" in display_name
-                            or "Microsoft Visio" in display_name
-                        ):
-                            continue
-
-                        found_names.add(display_name)
-                        display_version = self.registry.get_registry_value(
-                            uninstall_key_path, "DisplayVersion"
-                        )
-                        install_location = self.registry.get_registry_value(
-                            uninstall_key_path, "InstallLocation"
-                        )
-                        uninstall_string = self.registry.get_registry_value(
-                            uninstall_key_path, "UninstallString"
-                        )
-                        click_to_run = "ClickToRun" in uninstall_string
-
-                        # Versión: usa DisplayVersion, si no, VersionToReport
-                        version_final = (
-                            display_version
-                            or self.registry.get_registry_value(
-                                version_key, "VersionToReport"
-                            )
-                            or ""
-                        )
+                    found_names.add(display_name)
+                    details = self.registry.get_registry_values(
+                        uninstall_key_path,
+                        [
+                            "DisplayVersion",
+                            "InstallLocation",
+                            "UninstallString",
+                        ],
+                    )
+                    display_version = details["DisplayVersion"]
+                    install_location = details["InstallLocation"]
+                    uninstall_string = details["UninstallString"]
+                    click_to_run = "ClickToRun" in uninstall_string
 
-                        # Cultura: intenta extraerla del uninstall_string,
-                        # si no, usa ClientCulture
-                        match_culture = re.search(
-                            r"culture=([a-zA-Z\-]+)", uninstall_string
-                        )
-                        client_culture_final = (
-                            match_culture.group(1)
-                            if match_culture
-                            else client_culture
+                    # Versión: usa DisplayVersion, si no, VersionToReport
+                    version_final = (
+                        display_version
+                        or self.registry.get_registry_value(
+                            version_key, "VersionToReport"
                         )
+                        or ""
+                    )
 
-                        installations.append(
-                            OfficeInstallation(
-                                name=display_name,
-                                version=version_final,
-                                install_path=install_location,
-                                click_to_run=click_to_run,
-                                product=product_id,
-                                bitness=bitness,
-                                updates_enabled=updates_enabled,
-                                update_url=update_url,
-                                client_culture=client_culture_final,
-                                media_type=media_type,
-                                uninstall_string=uninstall_string,
-                            )
+                    installations.append(
+                        OfficeInstallation(
+                            name=display_name,
+                            version=version_final,
+                            install_path=install_location,
+                            click_to_run=click_to_run,
+                            product=product_id,
+                            bitness=bitness,
+                            updates_enabled=updates_enabled,
+                            update_url=update_url,
+                            # OfficeInstallation extrae la cultura del
+                            # uninstall_string; ClientCulture es el respaldo
+                            client_culture=client_culture,
+                            media_type=media_type,
+                            uninstall_string=uninstall_string,
                         )
+                    )
 
         self.installations = installations
+        self._scanned = True
         return installations
 
     def display_installations(self) -> None:
@@ -239,11 +291,16 @@ class OfficeManager:
                 )
             logging.info(f"{Fore.CYAN}{'-' * 80}{Style.RESET_ALL}")
 
-    def get_installations(self) -> List[OfficeInstallation]:
+    def get_installations(
+        self, refresh: bool = False
+    ) -> List[OfficeInstallation]:
         """
         Retorna la lista de instalaciones encontradas.
 
+        Args:
+            refresh (bool): Si es True, vuelve a escanear el registro.
+
         Returns:
             List[OfficeInstallation]: Lista de instalaciones actuales.
         """
-        return self._get_installations()
+        return self._get_installations(refresh)
@@ -7,23 +7,100 @@ segura y eficiente. Incluye manejo de errores y caché para optimizar el acceso.
 
 import logging
 import platform
+import threading
 import winreg
-from typing import Dict, List, Tuple
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from manager_office_tool.utils import safe_log_registry_key
 
+MAX_CACHE_SIZE = 4096  # límite para evitar crecimiento indefinido
+
+# Permisos de lectura; en sistemas de 64 bits se usa la vista nativa del
+# registro. La arquitectura no cambia durante la ejecución.
+_ACCESS_FLAG = winreg.KEY_READ | (
+    winreg.KEY_WOW64_64KEY if platform.machine().endswith("64") else 0
+)
+
+# Tipos de valor que se devuelven; el resto (DWORD, binarios...) se ignora
+_STRING_TYPES = frozenset({winreg.REG_SZ, winreg.REG_EXPAND_SZ})
+
 
 class RegistryReader:
     """
     Clase para leer claves y valores del registro de Windows de forma
     eficiente.
 
-    Utiliza un caché interno (_cache) para evitar lecturas repetidas de la
-    misma clave.
+    Utiliza un caché LRU interno (_cache) para evitar lecturas repetidas de
+    la misma clave. Los valores inexistentes también se guardan (como None)
+    para no volver a consultarlos. Las subclaves de cada clave se guardan
+    aparte (_subkeys_cache). Los cachés están protegidos por un lock, por lo
+    que una misma instancia puede usarse desde varios hilos.
+
+    Con open_keys() se pueden mantener abiertas claves raíz (_handles) para
+    que sus subclaves se abran de forma relativa.
     """
 
     def __init__(self) -> None:
-        self._cache: Dict[Tuple[str, str], str] = {}
+        self._cache: OrderedDict[Tuple[str, str], Optional[str]] = (
+            OrderedDict()
+        )
+        # Subclaves por ruta; una clave inexistente se guarda como lista vacía
+        self._subkeys_cache: Dict[str, List[str]] = {}
+        self._handles: Dict[str, winreg.HKEYType] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def open_keys(self, keys: List[str]) -> Iterator[None]:
+        """
+        Mantiene abiertas las claves indicadas mientras dura el bloque.
+
+        Las lecturas de esas claves y de sus subclaves directas se abren
+        relativas al handle ya abierto, en lugar de resolver la ruta
+        completa desde HKEY_LOCAL_MACHINE cada vez.
+
+        Args:
+            keys (List[str]): Rutas de las claves a mantener abiertas.
+        """
+        root_key = winreg.HKEY_LOCAL_MACHINE
+
+        handles: Dict[str, winreg.HKEYType] = {}
+        for key in keys:
+            try:
+                handles[key] = winreg.OpenKey(root_key, key, 0, _ACCESS_FLAG)
+            except OSError:
+                # Se informará en la lectura normal de la clave
+                continue
+        self._handles.update(handles)
+        try:
+            yield
+        finally:
+            for key, handle in handles.items():
+                self._handles.pop(key, None)
+                handle.Close()
+
+    def _open_key(self, key: str) -> winreg.HKEYType:
+        """
+        Abre una clave de HKEY_LOCAL_MACHINE, de forma relativa a un handle
+        de open_keys() si la clave o su padre están abiertos.
+        """
+        if key in self._handles:
+            return winreg.OpenKey(self._handles[key], "", 0, _ACCESS_FLAG)
+        parent, _, name = key.rpartition("\\")
+        if parent in self._handles:
+            return winreg.OpenKey(self._handles[parent], name, 0, _ACCESS_FLAG)
+        return winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key, 0, _ACCESS_FLAG)
+
+    def _add_to_cache(
+        self, cache_key: Tuple[str, str], value: Optional[str]
+    ) -> None:
+        with self._lock:
+            self._cache[cache_key] = value
+            self._cache.move_to_end(cache_key)  # Marca como más reciente
+            if len(self._cache) > MAX_CACHE_SIZE:
+                # Elimina el menos recientemente usado
+                self._cache.popitem(last=False)
 
     def get_registry_keys(self, key: str) -> List[str]:
         """
@@ -35,24 +112,27 @@ class RegistryReader:
         Returns:
             List[str]: Subclaves encontradas o lista vacía si hay error.
         """
-        root_key = winreg.HKEY_LOCAL_MACHINE
-        access_flag = winreg.KEY_READ | (
-            winreg.KEY_WOW64_64KEY if platform.machine().endswith("64") else 0
-        )
+        with self._lock:
+            cached = self._subkeys_cache.get(key)
+        if cached is not None:
+            return list(cached)
 
         subkeys: List[str] = []
         sanitized_key = safe_log_registry_key(key)
         try:
-            with winreg.OpenKey(root_key, key, 0, access_flag) as key_handle:
-                index = 0
-                while True:
-                    try:
-                        subkey = winreg.EnumKey(key_handle, index)
-                        subkeys.append(subkey)
-                        index += 1
-                    except OSError:
-                        break
+            with self._open_key(key) as key_handle:
+                # El número de subclaves se conoce de antemano, así no se
+                # depende de una excepción para terminar la enumeración
+                subkey_count, _, _ = winreg.QueryInfoKey(key_handle)
+                subkeys = [
+                    winreg.EnumKey(key_handle, index)
+                    for index in range(subkey_count)
+                ]
+            with self._lock:
+                self._subkeys_cache[key] = subkeys
         except FileNotFoundError:
+            with self._lock:
+                self._subkeys_cache[key] = []
             logging.warning(
                 f"Clave del registro no encontrada: '{sanitized_key}'"
             )
@@ -68,7 +148,7 @@ class RegistryReader:
                 f"'{sanitized_key}': {e}"
             )
 
-        return subkeys
+        return list(subkeys)
 
     def get_registry_value(self, key: str, value_name: str) -> str:
         """
@@ -81,52 +161,93 @@ class RegistryReader:
         Returns:
             str: Valor encontrado o cadena vacía.
         """
-        cache_key = (key, value_name)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        return self.get_registry_values(key, [value_name])[value_name]
 
-        root_key = winreg.HKEY_LOCAL_MACHINE
-        access_flag = winreg.KEY_READ | (
-            winreg.KEY_WOW64_64KEY if platform.machine().endswith("64") else 0
-        )
+    def get_registry_values(
+        self, key: str, value_names: List[str]
+    ) -> Dict[str, str]:
+        """
+        Obtiene varios valores de una misma clave del registro abriéndola una
+        sola vez (caché integrada).
+
+        Args:
+            key (str): Ruta de la clave.
+            value_names (List[str]): Nombres de los valores.
+
+        Returns:
+            Dict[str, str]: Valor encontrado para cada nombre, o cadena vacía
+                si no existe o no es de tipo cadena.
+        """
+        values: Dict[str, str] = {}
+        pending: List[str] = []
+        with self._lock:
+            for value_name in value_names:
+                cache_key = (key, value_name)
+                if cache_key in self._cache:
+                    self._cache.move_to_end(cache_key)
+                    cached = self._cache[cache_key]
+                    values[value_name] = cached if cached is not None else ""
+                else:
+                    values[value_name] = ""
+                    pending.append(value_name)
+
+        if not pending:
+            return values
 
         sanitized_key = safe_log_registry_key(key)
+        pending_names = ", ".join(pending)
 
         try:
-            with winreg.OpenKey(root_key, key, 0, access_flag) as key_handle:
-                try:
-                    value, _ = winreg.QueryValueEx(key_handle, value_name)
-                    self._cache[cache_key] = value
-                    return value
-                except FileNotFoundError:
-                    logging.warning(
-                        f"Valor '{value_name}' no encontrado en clave: "
-                        f"'{sanitized_key}'"
-                    )
-                except PermissionError:
-                    logging.error(
-                        f"Permiso denegado para leer '{value_name}' en clave: "
-                        f"'{sanitized_key}'"
-                    )
-                except OSError as e:
-                    logging.error(
-                        f"Error OS al leer '{value_name}' en clave "
-                        f"'{sanitized_key}': {e}"
-                    )
+            with self._open_key(key) as key_handle:
+                for value_name in pending:
+                    try:
+                        value, value_type = winreg.QueryValueEx(
+                            key_handle, value_name
+                        )
+                        if value_type not in _STRING_TYPES:
+                            # Solo interesan cadenas; otros tipos se tratan
+                            # como inexistentes
+                            self._add_to_cache((key, value_name), None)
+                            logging.debug(
+                                f"Valor '{value_name}' ignorado en clave "
+                                f"'{sanitized_key}': tipo {value_type} no "
+                                "es una cadena"
+                            )
+                            continue
+                        self._add_to_cache((key, value_name), value)
+                        values[value_name] = value
+                    except FileNotFoundError:
+                        self._add_to_cache((key, value_name), None)
+                        logging.warning(
+                            f"Valor '{value_name}' no encontrado en clave: "
+                            f"'{sanitized_key}'"
+                        )
+                    except PermissionError:
+                        logging.error(
+                            f"Permiso denegado para leer '{value_name}' en "
+                            f"clave: '{sanitized_key}'"
+                        )
+                    except OSError as e:
+                        logging.error(
+                            f"Error OS al leer '{value_name}' en clave "
+                            f"'{sanitized_key}': {e}"
+                        )
         except FileNotFoundError:
+            for value_name in pending:
+                self._add_to_cache((key, value_name), None)
             logging.warning(
-                f"Clave no encontrada al buscar valor '{value_name}': "
+                f"Clave no encontrada al buscar valor '{pending_names}': "
                 f"'{sanitized_key}'"
             )
         except PermissionError:
             logging.error(
                 f"Permiso denegado al abrir clave '{sanitized_key}' para leer "
-                f"'{value_name}'"
+                f"'{pending_names}'"
             )
         except Exception as e:
             logging.exception(
-                f"Excepción inesperada al leer '{value_name}' en clave "
+                f"Excepción inesperada al leer '{pending_names}' en clave "
                 f"'{sanitized_key}': {e}"
             )
 
-        return ""
+        return values
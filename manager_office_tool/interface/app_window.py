@@ -9,10 +9,9 @@ Utiliza ttkbootstrap para una GUI moderna y mensajes claros.
 """
 
 import logging
-import xml.dom.minidom as minidom
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
 import ttkbootstrap as tb
 import yaml
@@ -22,9 +21,29 @@ from manager_office_tool.utils import (
     center_window,
     get_data_path,
     safe_log_path,
+    write_bytes_atomic,
 )
 from ttkbootstrap.dialogs import Messagebox
 
+# Usa el parser en C de libyaml si está disponible (mismo comportamiento
+# que safe_load, pero sin recorrer el archivo en Python puro)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Contenido de config.yaml, leído una sola vez por proceso
+_CONFIG: Optional[dict[str, Any]] = None
+
+
+def _load_config() -> dict[str, Any]:
+    """
+    Devuelve la configuración de versiones, aplicaciones e idiomas,
+    leyendo config.yaml solo la primera vez.
+    """
+    global _CONFIG
+    if _CONFIG is None:
+        with open(get_data_path("config.yaml"), encoding="utf-8") as f:
+            _CONFIG = yaml.load(f, Loader=_YAML_LOADER)
+    return _CONFIG
+
 
 class OfficeSelectionWindow:
     """
@@ -42,8 +61,7 @@ class OfficeSelectionWindow:
         """
         self.office_install_dir = office_install_dir
 
-        with open(get_data_path("config.yaml"), encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config = _load_config()
 
         self.all_apps = config["office_apps"]
         self.versiones = config["office_versions"]
@@ -53,6 +71,7 @@ class OfficeSelectionWindow:
         self.root.iconbitmap(get_data_path("icon.ico"))
         self.app_vars: dict[str, tb.BooleanVar] = {}
         self.app_checkbuttons: list[tb.Checkbutton] = []
+        self._app_widgets: dict[str, tuple[tb.BooleanVar, tb.Checkbutton]] = {}
         self.cancelled: bool = False
         self.install_subdir_path: Path | None = None
 
@@ -76,16 +95,22 @@ class OfficeSelectionWindow:
         selected_version = self.combo_version.get()
         available_apps = self.all_apps.get(selected_version, [])
 
-        # Limpia los checkbuttons anteriores antes de mostrar los nuevos
+        # Oculta los checkbuttons anteriores antes de mostrar los nuevos
         for widget in self.app_checkbuttons:
-            widget.grid_forget()
+            widget.grid_remove()
         self.app_vars.clear()
         self.app_checkbuttons.clear()
 
+        # Cada aplicación tiene un único checkbutton, creado la primera vez
+        # que se muestra y reutilizado al cambiar de versión
         for i, app in enumerate(available_apps):
-            var = tb.BooleanVar()
+            if app not in self._app_widgets:
+                var = tb.BooleanVar()
+                cb = tb.Checkbutton(self.frame_apps, text=app, variable=var)
+                self._app_widgets[app] = (var, cb)
+            var, cb = self._app_widgets[app]
+            var.set(False)
             self.app_vars[app] = var
-            cb = tb.Checkbutton(self.frame_apps, text=app, variable=var)
             cb.grid(row=i, column=0, sticky="w", pady=3)
             self.app_checkbuttons.append(cb)
 
@@ -97,57 +122,24 @@ class OfficeSelectionWindow:
         if w != current_w or h != current_h:
             self.root.geometry(f"{w}x{h}")
 
-    def generate_configuration(
+    def _build_configuration_xml(
         self,
         selected_version: str,
         bits: str,
-        selected_language_name: str,
+        language_id: str,
         remove_msi: bool,
         selected_apps: list[str],
-    ) -> str | None:
+    ) -> bytes:
         """
-        Genera el archivo configuration.xml con las opciones seleccionadas por
-        el usuario.
+        Construye el contenido de configuration.xml a partir de las opciones
+        seleccionadas por el usuario.
 
         Returns:
-            str | None: Ruta al archivo generado o None si hubo error.
+            bytes: XML formateado y codificado en UTF-8.
         """
-        self.root.destroy()
-        familia = "2013" if "2013" in selected_version else "modern"
-        install_subdir = Path(self.office_install_dir) / f"OfficeODT_{familia}"
-        install_subdir.mkdir(parents=True, exist_ok=True)
-
-        odt_manager = ODTManager(str(install_subdir))
-        logging.info(
-            f"{Fore.CYAN}"
-            "Usando carpeta de instalación: "
-            f"{safe_log_path(install_subdir)}"
-            f"{Style.RESET_ALL}"
-        )
-
-        if not odt_manager.download_and_extract(selected_version):
-            msg = "[CONSOLE] Error. No se pudo descargar y extraer ODT."
-            logging.error(f"{Fore.RED}{msg}{Style.RESET_ALL}")
-            return None
-
-        if selected_version not in self.versiones:
-            Messagebox.show_error(
-                "Versión seleccionada no válida.",
-                title="Error",
-                parent=self.root,
-            )
-            return None
-
-        language_id = self.languages.get(selected_language_name)
-        if not language_id:
-            Messagebox.show_error(
-                "Idioma seleccionado no válido.",
-                title="Error",
-                parent=self.root,
-            )
-            return None
-
-        office_product_id = self.versiones[selected_version]["product_id"]
+        version_info = self.versiones[selected_version]
+        office_product_id = version_info["product_id"]
+        channel = version_info["channel"]
 
         # Determina los IDs de producto para Visio y Project según la versión
         # de Office seleccionada
@@ -179,9 +171,9 @@ class OfficeSelectionWindow:
 
         # Determina los productos a instalar según la selección del usuario
         products = ["Office"]
-        if "Visio" in selected_apps:
+        if "Visio" in selected_apps_set:
             products.append("Visio")
-        if "Project" in selected_apps:
+        if "Project" in selected_apps_set:
             products.append("Project")
 
         configuration = ET.Element("Configuration")
@@ -190,7 +182,7 @@ class OfficeSelectionWindow:
             "Add",
             {
                 "OfficeClientEdition": bits,
-                "Channel": self.versiones[selected_version]["channel"],
+                "Channel": channel,
             },
         )
 
@@ -220,13 +212,69 @@ class OfficeSelectionWindow:
             configuration, "Display", {"Level": "Full", "AcceptEULA": "TRUE"}
         )
 
+        ET.indent(configuration, space="  ")
+        return ET.tostring(
+            configuration, encoding="utf-8", xml_declaration=True
+        )
+
+    def generate_configuration(
+        self,
+        selected_version: str,
+        bits: str,
+        selected_language_name: str,
+        remove_msi: bool,
+        selected_apps: list[str],
+    ) -> str | None:
+        """
+        Genera el archivo configuration.xml con las opciones seleccionadas por
+        el usuario.
+
+        Returns:
+            str | None: Ruta al archivo generado o None si hubo error.
+        """
+        self.root.destroy()
+        familia = "2013" if "2013" in selected_version else "modern"
+        # ODTManager.download_and_extract crea la carpeta; configuration.xml
+        # solo se escribe después de una descarga correcta
+        install_subdir = Path(self.office_install_dir) / f"OfficeODT_{familia}"
+
+        if selected_version not in self.versiones:
+            Messagebox.show_error(
+                "Versión seleccionada no válida.",
+                title="Error",
+                parent=self.root,
+            )
+            return None
+
+        language_id = self.languages.get(selected_language_name)
+        if not language_id:
+            Messagebox.show_error(
+                "Idioma seleccionado no válido.",
+                title="Error",
+                parent=self.root,
+            )
+            return None
+
+        odt_manager = ODTManager(str(install_subdir))
+        logging.info(
+            f"{Fore.CYAN}"
+            "Usando carpeta de instalación: "
+            f"{safe_log_path(install_subdir)}"
+            f"{Style.RESET_ALL}"
+        )
+
+        pretty_xml = self._build_configuration_xml(
+            selected_version, bits, language_id, remove_msi, selected_apps
+        )
+
+        if not odt_manager.download_and_extract(selected_version):
+            msg = "[CONSOLE] Error. No se pudo descargar y extraer ODT."
+            logging.error(f"{Fore.RED}{msg}{Style.RESET_ALL}")
+            return None
+
         config_file_path = install_subdir / "configuration.xml"
         try:
-            rough_string = ET.tostring(configuration, encoding="utf-8")
-            reparsed = minidom.parseString(rough_string)
-            pretty_xml = reparsed.toprettyxml(indent="  ", encoding="utf-8")
-
-            config_file_path.write_bytes(pretty_xml)
+            write_bytes_atomic(config_file_path, pretty_xml)
 
             logging.debug(
                 "[*] Archivo de configuración generado exitosamente en: "
@@ -258,6 +306,23 @@ class OfficeSelectionWindow:
         bits = self.arch_var.get()
         selected_language_name = self.combo_language.get()
         remove_msi = self.remove_msi_var.get()
+        if not selected_version or not bits or not selected_language_name:
+            Messagebox.show_warning(
+                "Por favor selecciona una versión, arquitectura y lenguaje.",
+                title="Advertencia",
+                parent=self.root,
+            )
+            return
+        if selected_version not in self.versiones:
+            Messagebox.show_error(
+                "No se encontró la configuración de la versión seleccionada.",
+                title="Error",
+                parent=self.root,
+            )
+            return
+
+        # Las casillas se leen solo si la versión, arquitectura e idioma son
+        # válidos (cada var.get() es una consulta a Tcl)
         selected_apps = [
             app for app, var in self.app_vars.items() if var.get()
         ]
@@ -275,20 +340,6 @@ class OfficeSelectionWindow:
                 parent=self.root,
             )
             return
-        if not selected_version or not bits or not selected_language_name:
-            Messagebox.show_warning(
-                "Por favor selecciona una versión, arquitectura y lenguaje.",
-                title="Advertencia",
-                parent=self.root,
-            )
-            return
-        if selected_version not in self.versiones:
-            Messagebox.show_error(
-                "No se encontró la configuración de la versión seleccionada.",
-                title="Error",
-                parent=self.root,
-            )
-            return
 
         self.generate_configuration(
             selected_version,
@@ -321,13 +372,14 @@ class OfficeSelectionWindow:
         tb.Label(frame, text="Versión de Office:").grid(
             row=0, column=0, sticky="w", pady=(0, 6)
         )
+        version_names = list(self.all_apps)
         self.combo_version = tb.Combobox(
             frame,
             width=40,
             state="readonly",
-            values=list(self.all_apps.keys()),
+            values=version_names,
         )
-        self.combo_version.set(list(self.all_apps.keys())[0])
+        self.combo_version.set(version_names[0])
         self.combo_version.grid(row=1, column=0, sticky="ew", pady=(0, 12))
         self.combo_version.bind("<<ComboboxSelected>>", self.update_apps)
 
@@ -358,7 +410,7 @@ class OfficeSelectionWindow:
             values=sorted(self.languages.keys()),
             height=15,
         )
-        self.combo_language.set(list(self.languages.keys())[0])
+        self.combo_language.set(next(iter(self.languages)))
         self.combo_language.grid(row=0, column=3, sticky="w", padx=(8, 0))
 
         self.remove_msi_var = tb.BooleanVar()
@@ -7,11 +7,12 @@ Incluye validaciones y manejo de errores para una instalación robusta.
 """
 
 import logging
+import os
 import subprocess
 from pathlib import Path
 
 from colorama import Fore, Style
-from manager_office_tool.utils import safe_log_path
+from manager_office_tool.utils import run_setup_command, safe_log_path
 
 
 class OfficeInstaller:
@@ -59,19 +60,25 @@ class OfficeInstaller:
         sanitized_config_path = safe_log_path(config_path)
 
         # Verifica que setup.exe y configuration.xml existan antes de intentar
-        # la instalación
-        if not setup_path.exists():
-            msg = (
-                f"[CONSOLE] No se encontró 'setup.exe': {sanitized_setup_path}"
-            )
-            logging.error(f"{Fore.RED}{msg}{Style.RESET_ALL}")
-            return
-
-        if not config_path.exists():
-            msg = (
-                "[CONSOLE] No se encontró 'configuration.xml': "
-                f"{sanitized_config_path}"
-            )
+        # la instalación, con una sola lectura del directorio (Windows no
+        # distingue mayúsculas en los nombres)
+        try:
+            with os.scandir(office_dir) as entries:
+                present = {entry.name.lower() for entry in entries}
+        except OSError:
+            present = set()
+
+        required = {
+            "setup.exe": sanitized_setup_path,
+            "configuration.xml": sanitized_config_path,
+        }
+        missing = [
+            f"'{name}': {path}"
+            for name, path in required.items()
+            if name not in present
+        ]
+        if missing:
+            msg = f"[CONSOLE] No se encontró {', '.join(missing)}"
             logging.error(f"{Fore.RED}{msg}{Style.RESET_ALL}")
             return
 
@@ -86,13 +93,9 @@ class OfficeInstaller:
                 f"{Style.RESET_ALL}"
             )
 
-            subprocess.run(
-                command,
-                cwd=str(office_dir),
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            # La salida estándar no se usa: se descarta en lugar de
+            # acumularla en memoria
+            run_setup_command(command, office_dir)
 
             logging.info(
                 f"{Fore.GREEN}Instalación completada.{Style.RESET_ALL}"
@@ -9,15 +9,22 @@ de errores.
 import logging
 import re
 import subprocess
-import xml.dom.minidom as minidom
 import xml.etree.ElementTree as ET
 from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Optional
 
 from colorama import Fore, Style
 from manager_office_tool.core import ODTManager, OfficeInstallation
-from manager_office_tool.utils import safe_log_path
+from manager_office_tool.utils import (
+    run_setup_command,
+    safe_log_path,
+    write_bytes_atomic,
+)
+
+# Sufijo de idioma al final del nombre de producto, p. ej. " - es-es"
+_CULTURE_SUFFIX_RE = re.compile(r"\s-\s[a-z]{2}-[a-z]{2}$")
 
 
 class OfficeUninstaller:
@@ -73,29 +80,18 @@ class OfficeUninstaller:
             configuration, "Display", Level="None", AcceptEULA="TRUE"
         )
 
-        # Paths
-        uninstall_dir = Path(self.office_uninstall_dir)
-        file_path = Path(self.odt_manager.office_dir) / "configuration.xml"
-        sanitized_uninstall_path = safe_log_path(uninstall_dir)
+        # El XML se guarda junto a setup.exe, en la carpeta de ODT que ya
+        # creó la descarga (dentro del directorio de desinstalación)
+        file_path = self.odt_manager.office_dir / "configuration.xml"
         sanitized_file_path = safe_log_path(file_path)
 
         try:
-            uninstall_dir.mkdir(parents=True, exist_ok=True)
-        except PermissionError:
-            msg = (
-                "[CONSOLE] No se pudo crear el directorio de desinstalación: "
-                f"{sanitized_uninstall_path}"
-            )
-            logging.error(f"{Fore.RED}{msg}{Style.RESET_ALL}")
-            raise
-
-        try:
-            rough_string = ET.tostring(configuration, encoding="utf-8")
-            pretty_xml = minidom.parseString(rough_string).toprettyxml(
-                indent="  ", encoding="utf-8"
+            ET.indent(configuration, space="  ")
+            pretty_xml = ET.tostring(
+                configuration, encoding="utf-8", xml_declaration=True
             )
 
-            file_path.write_bytes(pretty_xml)
+            write_bytes_atomic(file_path, pretty_xml)
             logging.debug(
                 "[*] Archivo de configuración XML de desinstalación "
                 f"generado en: {sanitized_file_path}"
@@ -129,7 +125,7 @@ class OfficeUninstaller:
             f"{Style.RESET_ALL}"
         )
 
-        office_uninstall_path = Path(self.odt_manager.office_dir)
+        office_uninstall_path = self.odt_manager.office_dir
         self.setup_path = office_uninstall_path / "setup.exe"
         sanitized_uninstall_path = safe_log_path(office_uninstall_path)
 
@@ -159,16 +155,13 @@ class OfficeUninstaller:
                 f"{Style.RESET_ALL}"
             )
 
-            result = subprocess.run(
+            # stdout se vuelca al log a medida que llega
+            run_setup_command(
                 [str(self.setup_path), "/configure", config_path],
-                cwd=str(office_uninstall_path),
-                capture_output=True,
-                text=True,
-                check=True,
+                office_uninstall_path,
+                log_stdout=True,
             )
 
-            logging.debug(f"setup.exe stdout:\n{result.stdout}")
-
             return True
 
         except subprocess.CalledProcessError as e:
@@ -217,7 +210,7 @@ class OfficeUninstaller:
 
 def get_base_name(name: str) -> str:
     # Esto quita el código de idioma al final en formato " - xx-xx"
-    return re.sub(r"\s-\s[a-z]{2}-[a-z]{2}$", "", name)
+    return _CULTURE_SUFFIX_RE.sub("", name)
 
 
 def normalize_culture(culture: str) -> str:
@@ -252,13 +245,18 @@ def run_uninstallers(
 
     odt_managers: dict[str, ODTManager] = {}
 
-    # Primero ordenar para agrupar correctamente
-    installations.sort(key=lambda x: (get_base_name(x.name), x.product))
+    # Calcula la clave de agrupación una sola vez por instalación y ordena
+    # por ella para agrupar correctamente
+    keyed = sorted(
+        (
+            ((get_base_name(inst.name), inst.product), inst)
+            for inst in installations
+        ),
+        key=itemgetter(0),
+    )
 
-    for (base_name, product), group in groupby(
-        installations, key=lambda x: (get_base_name(x.name), x.product)
-    ):
-        group_list = list(group)
+    for (base_name, product), group in groupby(keyed, key=itemgetter(0)):
+        group_list = [inst for _, inst in group]
 
         logging.info(
             f"{Fore.LIGHTYELLOW_EX}"
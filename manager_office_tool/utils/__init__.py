@@ -2,7 +2,8 @@
 Subpaquete utils de ManagerOfficeScriptTool.
 
 Contiene utilidades generales para consola, GUI, logging y manejo seguro de
-rutas y carpetas temporales.
+rutas y carpetas temporales, el pool de hilos compartido y la ejecución
+de setup.exe.
 """
 
 from .console_utils import (
@@ -10,9 +11,11 @@ from .console_utils import (
     ask_multiple_valid_indices,
     ask_single_valid_index,
     ask_yes_no,
+    is_unattended,
+    unattended_uninstall,
 )
 from .gui_utils import center_window
-from .logging_utils import init_logging
+from .logging_utils import flush_logs, init_logging
 from .path_utils import (
     clean_folders,
     ensure_subfolder,
@@ -20,19 +23,28 @@ from .path_utils import (
     get_temp_dir,
     safe_log_path,
     safe_log_registry_key,
+    write_bytes_atomic,
 )
+from .process_utils import run_setup_command
+from .thread_utils import get_executor
 
 __all__ = [
     "ask_yes_no",
     "ask_menu_option",
     "ask_single_valid_index",
     "ask_multiple_valid_indices",
+    "is_unattended",
+    "unattended_uninstall",
     "center_window",
     "init_logging",
+    "flush_logs",
     "clean_folders",
     "ensure_subfolder",
     "get_data_path",
     "get_temp_dir",
     "safe_log_path",
     "safe_log_registry_key",
+    "write_bytes_atomic",
+    "run_setup_command",
+    "get_executor",
 ]
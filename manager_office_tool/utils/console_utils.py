@@ -2,31 +2,80 @@
 console_utils.py
 
 Utilidades para interacción básica con el usuario en consola.
-Incluye funciones para preguntas de sí/no con validación robusta.
+Incluye funciones para preguntas de sí/no con validación robusta y un modo
+desatendido (variable de entorno OFFICE_UNATTENDED) que responde las
+preguntas con su valor por defecto. En ese modo, OFFICE_UNATTENDED_UNINSTALL
+indica si se desinstalan las versiones detectadas.
 """
 
 import logging
+import os
+from typing import Optional
 
 from colorama import Fore, Style
 
+# Respuestas aceptadas en ask_yes_no (ya normalizadas a minúsculas)
+_YES = frozenset({"s", "sí", "si", "y", "yes"})
+_NO = frozenset({"n", "no"})
 
-def ask_yes_no(message: str) -> bool:
+# Variables de entorno del modo desatendido y valores que las activan
+UNATTENDED_ENV_VAR = "OFFICE_UNATTENDED"
+UNATTENDED_UNINSTALL_ENV_VAR = "OFFICE_UNATTENDED_UNINSTALL"
+_UNATTENDED_VALUES = frozenset({"1", "true", "yes", "s", "si", "sí"})
+
+
+def _env_flag(name: str) -> bool:
+    """
+    Indica si la variable de entorno indicada tiene un valor afirmativo.
+    """
+    return os.environ.get(name, "").strip().lower() in _UNATTENDED_VALUES
+
+
+def is_unattended() -> bool:
+    """
+    Indica si la herramienta se ejecuta en modo desatendido, es decir, si
+    la variable de entorno OFFICE_UNATTENDED tiene un valor afirmativo.
+
+    Returns:
+        bool: True si no se debe esperar respuesta del usuario.
+    """
+    return _env_flag(UNATTENDED_ENV_VAR)
+
+
+def unattended_uninstall() -> bool:
+    """
+    Indica si, en modo desatendido, se deben desinstalar todas las
+    versiones de Office detectadas (OFFICE_UNATTENDED_UNINSTALL).
+
+    Returns:
+        bool: True solo en modo desatendido y con la variable activada.
+    """
+    return is_unattended() and _env_flag(UNATTENDED_UNINSTALL_ENV_VAR)
+
+
+def ask_yes_no(message: str, default: Optional[bool] = None) -> bool:
     """
     Pregunta al usuario en consola y retorna True si la respuesta es
     afirmativa.
 
     Args:
         message (str): Mensaje a mostrar al usuario.
+        default (bool | None): Respuesta usada en modo desatendido. Si es
+            None, se pregunta siempre.
 
     Returns:
         bool: True si la respuesta es afirmativa, False en caso contrario.
     """
+    if default is not None and is_unattended():
+        respuesta = "S" if default else "N"
+        logging.info(f"{message} {respuesta} (modo desatendido)")
+        return default
     while True:
         print(f"INFO - {message} ", end="", flush=True)
         respuesta = input().strip().lower()
-        if respuesta in ("s", "sí", "si"):
+        if respuesta in _YES:
             return True
-        elif respuesta in ("n", "no"):
+        elif respuesta in _NO:
             return False
         else:
             msg = (
@@ -35,7 +84,9 @@ def ask_yes_no(message: str) -> bool:
             logging.warning(f"{Fore.YELLOW}{msg}{Style.RESET_ALL}")
 
 
-def ask_menu_option(valid_options: set[str], prompt: str) -> str:
+def ask_menu_option(
+    valid_options: set[str], prompt: str, default: Optional[str] = None
+) -> str:
     """
     Pregunta al usuario por una opción válida del menú dentro de valid_options.
     Repite la pregunta hasta que se ingrese una opción válida o se cancele.
@@ -43,10 +94,15 @@ def ask_menu_option(valid_options: set[str], prompt: str) -> str:
     Args:
         valid_options (set[str]): Opciones válidas.
         prompt (str): Mensaje a mostrar al usuario.
+        default (str | None): Opción usada en modo desatendido. Si es None,
+            se pregunta siempre.
 
     Returns:
         str: Opción válida o "cancel" si el usuario cancela.
     """
+    if default is not None and is_unattended():
+        logging.info(f"{prompt}: {default} (modo desatendido)")
+        return default
     options_str = "/".join(sorted(valid_options))
     while True:
         user_input = (
@@ -4,11 +4,20 @@ logging_utils.py
 Utilidades para inicializar y configurar el logging de la aplicación.
 Incluye un filtro personalizado para mostrar mensajes INFO y
 advertencias/errores marcados en consola, y guarda todos los logs
-en archivo.
+en archivo desde un hilo en segundo plano.
 """
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Optional
+
+# Listener activo que escribe en el archivo de log (uno por proceso) y la
+# cola de la que lee
+_LISTENER: Optional[QueueListener] = None
+_LOG_QUEUE: Optional[queue.Queue[logging.LogRecord]] = None
 
 
 class InfoAndConsoleMarkFilter(logging.Filter):
@@ -49,17 +58,27 @@ def init_logging(logs_path: str) -> None:
     """
     Inicializa el sistema de logging:
     - Crea el directorio de logs si no existe.
-    - Guarda todos los mensajes en 'application.log'.
+    - Guarda todos los mensajes en 'application.log' mediante una cola:
+        el archivo se escribe en un hilo aparte y quien registra no espera
+        la E/S de disco.
     - Muestra solo INFO y advertencias/errores marcados en consola.
 
     Args:
         logs_path (str): Ruta donde se almacenarán los logs.
     """
+    global _LISTENER, _LOG_QUEUE
+
     path = Path(logs_path)
     path.mkdir(parents=True, exist_ok=True)
 
     log_file = path / "application.log"
 
+    # Los formatos no usan hilo ni proceso: se evita consultarlos en cada
+    # registro
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     logger = logging.getLogger()
     logger.setLevel(logging.DEBUG)
 
@@ -76,8 +95,48 @@ def init_logging(logs_path: str) -> None:
     console_formatter = ConsoleFormatter("%(levelname)s - %(message)s")
     console_handler.setFormatter(console_formatter)
 
+    # La consola se mantiene síncrona para no desordenar los mensajes
+    # respecto de las preguntas con input()
+    _stop_listener()
+    _LOG_QUEUE = queue.Queue()
+    _LISTENER = QueueListener(
+        _LOG_QUEUE, file_handler, respect_handler_level=True
+    )
+    _LISTENER.start()
+
     logger.handlers.clear()
-    logger.addHandler(file_handler)
+    logger.addHandler(QueueHandler(_LOG_QUEUE))
     logger.addHandler(console_handler)
 
     logger.propagate = False
+
+
+def flush_logs() -> None:
+    """
+    Espera a que el hilo del listener escriba los registros pendientes en
+    el archivo de log y vacía todos los handlers.
+    """
+    if _LISTENER is not None and _LOG_QUEUE is not None:
+        # QueueListener marca cada registro con task_done() al procesarlo
+        _LOG_QUEUE.join()
+        for handler in _LISTENER.handlers:
+            handler.flush()
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
+def _stop_listener() -> None:
+    """
+    Vacía la cola pendiente y cierra el archivo de log al salir.
+    """
+    global _LISTENER, _LOG_QUEUE
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        for handler in _LISTENER.handlers:
+            handler.close()
+        _LISTENER = None
+        _LOG_QUEUE = None
+
+
+# Se registra una sola vez; no hace nada si no hay listener activo
+atexit.register(_stop_listener)
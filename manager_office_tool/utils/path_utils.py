@@ -7,27 +7,37 @@ asegurar subcarpetas, y limpiar rutas sensibles antes de mostrarlas en logs.
 """
 
 import logging
+import os
 import shutil
+import stat
+import subprocess
 import sys
 import tempfile
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import Callable, List, Optional, Tuple, Union
 
 from colorama import Fore, Style
 
+from .thread_utils import get_executor
+
+if getattr(sys, "frozen", False):
+    # Ejecutando como binario (Nuitka, PyInstaller, etc.)
+    _BASE_PATH = Path(sys.executable).parent
+else:
+    # Ejecutando como script normal
+    _BASE_PATH = Path(__file__).resolve().parents[2]  # Raíz del proyecto
+
 
 def get_data_path(filename: str) -> Path:
     """
     Devuelve la ruta absoluta a un archivo de datos (como config.yaml),
     compatible tanto en desarrollo como empaquetado con Nuitka.
+
+    La carpeta base se calcula una sola vez al importar el módulo.
     """
-    if getattr(sys, "frozen", False):
-        # Ejecutando como binario (Nuitka, PyInstaller, etc.)
-        base_path = Path(sys.executable).parent
-    else:
-        # Ejecutando como script normal
-        base_path = Path(__file__).resolve().parents[2]  # Raíz del proyecto
-    path = base_path / filename
+    path = _BASE_PATH / filename
 
     if not path.exists():
         raise FileNotFoundError(f"No se encontró el archivo: {path}")
@@ -57,15 +67,41 @@ def ensure_subfolder(parent: Path, name: str) -> Path:
     return folder
 
 
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """
+    Escribe el contenido completo en un archivo temporal de la misma carpeta
+    y luego lo renombra sobre el destino, de modo que nunca quede un archivo
+    escrito a medias si el proceso se interrumpe.
+
+    Args:
+        path (Path): Archivo de destino.
+        data (bytes): Contenido a escribir.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# Carpeta del usuario, resuelta una sola vez (no cambia durante la ejecución)
+_USER_HOME = str(Path.home())
+
+
 # Sanitiza rutas para evitar exponer información sensible en los logs
+@lru_cache(maxsize=128)
 def safe_log_path(path: Union[str, Path]) -> str:
     """
     Convierte rutas sensibles a una forma anonimizada para el log.
     Reemplaza la carpeta del usuario con %USERPROFILE%.
+    El resultado se memoriza, ya que las mismas rutas se registran varias
+    veces durante una ejecución.
     """
     try:
         path_obj = Path(path)
-        return str(path_obj).replace(str(Path.home()), "%USERPROFILE%")
+        return str(path_obj).replace(_USER_HOME, "%USERPROFILE%")
     except Exception:
         return str(path)
 
@@ -79,12 +115,130 @@ def safe_log_registry_key(reg_path: str) -> str:
     )
 
 
+# Caracteres que cmd.exe interpretaría dentro de la ruta. subprocess solo
+# entrecomilla rutas con espacios, y ",;=" separan argumentos: rd borraría
+# cada parte como una carpeta distinta
+_CMD_UNSAFE_CHARS = frozenset('%^&|<>",;=')
+
+RMTREE_RETRIES = 3  # intentos por entrada que falló al eliminar
+RMTREE_RETRY_DELAY = 0.5  # segundos; crece con cada intento
+# Solo se reintentan los borrados, no los errores al listar carpetas
+_RETRYABLE_FUNCS = (os.unlink, os.remove, os.rmdir)
+
+
+def _rmtree(path: Path) -> None:
+    """
+    Elimina un árbol de carpetas. En Windows delega primero en "rd /s /q",
+    que borra miles de archivos mucho más rápido que shutil.rmtree; si falla
+    o deja restos, se usa shutil.rmtree, que además informa el error real.
+
+    Args:
+        path (Path): Carpeta a eliminar.
+    """
+    if os.name == "nt" and not _CMD_UNSAFE_CHARS.intersection(str(path)):
+        try:
+            result = subprocess.run(
+                ["cmd", "/d", "/c", "rd", "/s", "/q", str(path)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            if result.returncode == 0 and not path.exists():
+                return
+        except OSError as e:
+            logging.debug(f"No se pudo ejecutar rd, se usa shutil: {e}")
+
+    # Las entradas que no se pueden borrar (archivos de solo lectura o aún
+    # bloqueados por setup.exe) se anotan y se reintentan al final, sin
+    # volver a recorrer el árbol completo
+    failed: List[Tuple[Callable[[str], None], str]] = []
+
+    def _on_error(func: Callable, failed_path: str, exc) -> None:
+        if func not in _RETRYABLE_FUNCS:
+            # onexc recibe la excepción; onerror, la tupla de exc_info
+            raise exc if isinstance(exc, BaseException) else exc[1]
+        failed.append((func, failed_path))
+
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_on_error)
+    else:
+        shutil.rmtree(path, onerror=_on_error)
+
+    # El recorrido es post-orden: los archivos van antes que sus carpetas
+    for func, failed_path in failed:
+        _retry_remove(func, failed_path)
+
+
+def _retry_remove(func: Callable[[str], None], path: str) -> None:
+    """
+    Reintenta eliminar una entrada quitando el atributo de solo lectura y
+    esperando brevemente entre intentos. Relanza el último error.
+
+    Args:
+        func (Callable[[str], None]): os.unlink u os.rmdir, según la entrada.
+        path (str): Ruta de la entrada a eliminar.
+    """
+    for attempt in range(1, RMTREE_RETRIES + 1):
+        try:
+            os.chmod(path, stat.S_IWRITE)
+            func(path)
+            return
+        except FileNotFoundError:
+            return
+        except OSError:
+            if attempt == RMTREE_RETRIES:
+                raise
+            time.sleep(RMTREE_RETRY_DELAY * attempt)
+
+
+def _clean_folder(folder_path: Path) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Elimina una carpeta y registra el resultado.
+
+    Args:
+        folder_path (Path): Carpeta a eliminar.
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: (eliminada, error); cada valor es
+            None si no corresponde.
+    """
+    sanitized_path = safe_log_path(folder_path)
+    # Sin comprobación previa con is_dir(): la propia eliminación informa si
+    # la ruta no existe o no es una carpeta
+    try:
+        _rmtree(folder_path)
+        logging.info(
+            f"{Fore.GREEN}"
+            f"Carpeta eliminada: {sanitized_path}"
+            f"{Style.RESET_ALL}"
+        )
+        return str(folder_path), None
+    except (FileNotFoundError, NotADirectoryError):
+        logging.debug(
+            f"La ruta no es una carpeta o no existe: {sanitized_path}"
+        )
+    except PermissionError:
+        msg = (
+            "[CONSOLE] Permiso denegado al eliminar la carpeta: "
+            f"{sanitized_path}"
+        )
+        logging.error(f"{Fore.RED}{msg}{Style.RESET_ALL}")
+        return None, msg
+    except OSError as e:
+        msg = f"[CONSOLE] Error eliminando {sanitized_path}: {e}"
+        logging.error(f"{Fore.RED}{msg}{Style.RESET_ALL}")
+        return None, msg
+    return None, None
+
+
 def clean_folders(folders: List[Path]) -> Tuple[List[str], List[str]]:
     """
     Intenta eliminar las carpetas indicadas.
     Devuelve dos listas: eliminadas y errores.
     Además, registra logs para cada acción relevante.
 
+    Las carpetas son árboles independientes, por lo que se eliminan en
+    paralelo; los resultados conservan el orden de entrada.
+
     Args:
         folders (List[Path]): Lista de carpetas a eliminar.
 
@@ -92,34 +246,9 @@ def clean_folders(folders: List[Path]) -> Tuple[List[str], List[str]]:
         Tuple[List[str], List[str]]: (eliminadas, errores)
     """
     eliminadas, errores = [], []
-    for folder_path in folders:
-        folder_path = Path(folder_path)
-        sanitized_path = safe_log_path(folder_path)
-        try:
-            if folder_path.is_dir():
-                shutil.rmtree(folder_path)
-                eliminadas.append(str(folder_path))
-                logging.info(
-                    f"{Fore.GREEN}"
-                    f"Carpeta eliminada: {sanitized_path}"
-                    f"{Style.RESET_ALL}"
-                )
-            else:
-                logging.debug(
-                    f"La ruta no es una carpeta o no existe: {sanitized_path}"
-                )
-        except PermissionError:
-            msg = (
-                "[CONSOLE] Permiso denegado al eliminar la carpeta: "
-                f"{sanitized_path}"
-            )
-            logging.error(f"{Fore.RED}{msg}{Style.RESET_ALL}")
-            errores.append(msg)
-        except FileNotFoundError:
-            msg = f"[CONSOLE] La carpeta ya no existe: {sanitized_path}"
-            logging.warning(f"{Fore.YELLOW}{msg}{Style.RESET_ALL}")
-        except OSError as e:
-            msg = f"[CONSOLE] Error eliminando {sanitized_path}: {e}"
-            logging.error(f"{Fore.RED}{msg}{Style.RESET_ALL}")
-            errores.append(msg)
+    for eliminada, error in get_executor().map(_clean_folder, folders):
+        if eliminada:
+            eliminadas.append(eliminada)
+        if error:
+            errores.append(error)
     return eliminadas, errores
@@ -0,0 +1,55 @@
+"""
+process_utils.py
+
+Utilidades para ejecutar setup.exe (Office Deployment Tool) y recoger sus
+errores sin acumular la salida en memoria.
+"""
+
+import locale
+import logging
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import List, Union
+
+
+def run_setup_command(
+    command: List[str], cwd: Union[str, Path], log_stdout: bool = False
+) -> None:
+    """
+    Ejecuta un comando de setup.exe y espera a que termine.
+
+    stderr va a un archivo temporal y solo se lee si el proceso falla; se
+    decodifica con la codificación del sistema, igual que text=True.
+
+    Args:
+        command (List[str]): Comando y argumentos a ejecutar.
+        cwd (str | Path): Carpeta de trabajo del proceso.
+        log_stdout (bool): Si es True, cada línea de stdout se registra en
+            el log (debug) a medida que llega; si no, se descarta.
+
+    Raises:
+        subprocess.CalledProcessError: Si el proceso termina con un código
+            distinto de cero; incluye el texto de stderr.
+    """
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(
+            command,
+            cwd=str(cwd),
+            stdout=subprocess.PIPE if log_stdout else subprocess.DEVNULL,
+            stderr=stderr_file,
+            text=True,
+        ) as process:
+            if process.stdout is not None:
+                for line in process.stdout:
+                    logging.debug(f"setup.exe stdout: {line.rstrip()}")
+
+        if process.returncode:
+            stderr_file.seek(0)
+            raise subprocess.CalledProcessError(
+                process.returncode,
+                command,
+                stderr=stderr_file.read().decode(
+                    locale.getpreferredencoding(False), errors="replace"
+                ),
+            )
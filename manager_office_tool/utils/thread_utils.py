@@ -0,0 +1,39 @@
+"""
+thread_utils.py
+
+Pool de hilos compartido para el trabajo breve en segundo plano de la
+aplicación (lecturas del registro y limpieza de carpetas temporales).
+Los hilos se crean una sola vez por proceso y se reutilizan en cada tarea.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+MAX_WORKERS = min(8, os.cpu_count() or 4)
+
+# Pool compartido (uno por proceso), creado en el primer uso
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Devuelve el pool de hilos compartido, creándolo la primera vez.
+
+    Las tareas enviadas no deben esperar a otras tareas del mismo pool,
+    para no bloquearlo. Al salir, el intérprete espera a que terminen las
+    tareas en curso, por lo que las tareas largas (como la descarga de ODT)
+    no deben enviarse aquí.
+
+    Returns:
+        ThreadPoolExecutor: Pool reutilizable para tareas en segundo plano.
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=MAX_WORKERS, thread_name_prefix="ManagerOffice"
+            )
+        return _EXECUTOR